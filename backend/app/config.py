@@ -1,8 +1,10 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load configuration"""
+    """Load configuration (cached and shared - do not mutate; load_config.cache_clear() reloads)"""
     default_config = {
         "supplier_block": {
             "name": "Elbit Systems C4I and Cyber Ltd",
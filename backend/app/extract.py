@@ -9,6 +9,131 @@ import logging
 # Use uvicorn logger to ensure logs appear in console
 logger = logging.getLogger("uvicorn")
 
+# Date already in display format (e.g., 20/Mar/2025)
+DISPLAY_DATE_PATTERN = re.compile(r'\d{2}/\w{3}/\d{4}')
+
+# Input date formats accepted by normalize_date, grouped by separator so only
+# formats that can possibly match are tried
+DATE_SEPARATOR_PATTERN = re.compile(r'[/.\-]')
+DATE_FORMATS_BY_SEPARATOR = {
+    "/": (
+        "%d/%m/%Y",      # 20/03/2025
+        "%d/%b/%Y",      # 20/Mar/2025
+        "%d/%B/%Y",      # 20/March/2025
+        "%d/%m/%y",      # 20/03/25
+    ),
+    ".": (
+        "%d.%m.%Y",      # 20.03.2025
+        "%d.%m.%y",      # 20.03.25
+    ),
+    "-": (
+        "%d-%m-%Y",      # 20-03-2025
+        "%Y-%m-%d",      # 2025-03-20
+    ),
+}
+
+# Serial numbers: NL followed by exactly 5 digits
+SERIAL_NUMBER_PATTERN = re.compile(r'NL\d{5}')
+SERIAL_SECTION_PATTERN = re.compile(r'Serial\s+Number.*?(?=We certify|Quality|$)', re.DOTALL | re.IGNORECASE)
+CUSTOMER_PREFIX_PATTERN = re.compile(r'^Customer\s*', re.IGNORECASE)
+
+# Packing slip header/rows
+SHIP_TO_PATTERN = re.compile(r'Ship\s+To[:\s]+([\s\S]+?)(?:Sold\s+To|Contract|Our\s+Reference)', re.IGNORECASE)
+CUSTOMER_ITEM_PATTERN = re.compile(r'Customers?\s+Item[:\s]+(\d+)', re.IGNORECASE)
+# Item rows: Dlv (1-3 digits), Part No (11 digits), Description, Qty, EA
+ITEM_ROW_PATTERN = re.compile(r'(\d{1,3})\s+(\d{11})\s+([\w\s\-]+?)\s+(\d+\.?\d*)\s*EA', re.IGNORECASE)
+
+# Known "Sold To" content that pdfplumber interleaves into the Ship To column
+SOLD_TO_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'NETHERLANDS\s+MINISTRY',
+        r'\bCOMMIT\b',
+        r'Projects?\s+Procurement',
+        r'Herculeslaan',
+        r'Utrecht\s+MPC',
+        r'The\s+Netherlands$',
+        r'Sold\s+To',
+    )
+]
+
+# Company COC header fields; each list is tried in order and the first match wins
+COC_CONTRACT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Order[:\s]+(\d+\.\d+\.\d+\.\d+)',
+        r'Contract[:\s]+(\d+\.\d+\.\d+\.\d+)',
+        r'Order\s+No[:\s]+(\d+\.\d+\.\d+\.\d+)',
+    )
+]
+COC_NUMBER_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(COC\d{6})\b',  # COC followed by exactly 6 digits (word boundaries)
+        r'COC\s*(?:No\.?|Number)[:\s]+(COC\d{6})',  # "COC No: COC011285" format
+        r'Certificate\s+(?:No|Number)[:\s]+(COC\d{6})',  # "Certificate No: COC011285"
+    )
+]
+COC_SHIPMENT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Shipment\s+no[.:\s]+(\w+)',
+        r'Shipment[:\s]+(\w+)',
+    )
+]
+PRODUCT_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'(\d{11})\s+(PNR-\S+\s+\w+)',  # More specific: code + PNR-XXX + one word
+        r'(\d{11})[;\s]+(PNR-[\w-]+(?:\s+\w+)?)',  # code; PNR-XXX optionally one more word
+        r'(\d{11})\s+([\w-]+Radio[\w\s-]*)',
+    )
+]
+COC_QUANTITY_PATTERNS = [
+    re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+        r'(?:QTY|Quantity)\s+(?:Order|Shipped)[:\s]+(\d{1,4})(?:\s|$)',  # 1-4 digits only
+        r'Quantity[:\s]+(\d{1,4})(?:\s|$)',
+        r'QTY[:\s]+(\d{1,4})(?:\s|$)',
+        r'(?:QTY|Quantity).*?(?:Shipped|Delivered)[:\s]+(\d{1,4})',
+    )
+]
+CUSTOMER_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        r'(?:Customer|Acquirer)[:\s]+\n?([\w\s]+?)(?:\n\n|\nPart\s+number|$)',
+        r'(NETHERLANDS MINISTRY OF DEFENCE)',
+    )
+]
+QA_PATTERNS = [
+    re.compile(pattern, re.DOTALL) for pattern in (
+        r'Quality\s+Authority.*?\n([A-Z][A-Z\s]+?)\s+\d+\s+(\d+/\w+/\d+)',  # Name, then number, then date
+        r'Quality\s+Authority.*?\n([A-Z][A-Z\s]+?)\s+(\d+/\w+/\d+)',  # Name directly before date
+        r'QA.*?\n([A-Z][A-Z\s]+?)\s+(\d+/\w+/\d+)',
+    )
+]
+
+# Packing slip header fields and single-item fallbacks
+PACKING_SLIP_SHIPMENT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Packing\s+Slip\s+([A-Z0-9]{8,12})',  # "Packing Slip 6SH264587"
+        r'Shipment[:\s]+([A-Z0-9]{8,12})',  # "Shipment: 6SH264587"
+        r'\b(\d{1,2}[A-Z]{2}\d{6})\b',  # Elbit format: "6SH264587"
+    )
+]
+PACKING_SLIP_FILENAME_PATTERN = re.compile(r'Packing[_\s]?Slip[_\s]?([A-Z0-9]{8,12})', re.IGNORECASE)
+PACKING_SLIP_CONTRACT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Contract[:\s]+[\w\s]*?([\d.]+)',
+        r'Our\s+Reference[:\s]+([\d.]+)',
+    )
+]
+PART_PATTERNS = [
+    re.compile(pattern, re.DOTALL) for pattern in (
+        r'(\d{11})\s+([\w\s-]+?)\s+(\d+\.\d+)\s+EA',
+        r'Part\s+No[:\s]+(\d{11}).*?Description[:\s]+([\w\s-]+)',
+    )
+]
+PACKING_SLIP_QUANTITY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(\d+\.\d+)\s+EA',
+        r'Quantity[:\s]+(\d+)',
+    )
+]
+
 def extract_from_pdfs(company_coc_path: Optional[str], packing_slip_path: Optional[str]) -> Dict[str, Any]:
     """Extract data from PDFs using pdfplumber"""
 
@@ -103,13 +228,8 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
 
                 # Extract Contract/Order number
                 # Pattern: "Order 697.12.5011.01" or "Contract 697.12.5011.01"
-                contract_patterns = [
-                    r'Order[:\s]+(\d+\.\d+\.\d+\.\d+)',
-                    r'Contract[:\s]+(\d+\.\d+\.\d+\.\d+)',
-                    r'Order\s+No[:\s]+(\d+\.\d+\.\d+\.\d+)',
-                ]
-                for pattern in contract_patterns:
-                    contract_match = re.search(pattern, text, re.IGNORECASE)
+                for pattern in COC_CONTRACT_PATTERNS:
+                    contract_match = pattern.search(text)
                     if contract_match:
                         data['contract_number'] = contract_match.group(1)
                         logger.info(f"Found contract number: {data['contract_number']}")
@@ -118,13 +238,8 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
                 # Extract COC Number
                 # Pattern: "COC011285" - COC followed by exactly 6 digits
                 # The COC number is a standalone identifier, not part of other numbers
-                coc_patterns = [
-                    r'\b(COC\d{6})\b',  # COC followed by exactly 6 digits (word boundaries)
-                    r'COC\s*(?:No\.?|Number)[:\s]+(COC\d{6})',  # "COC No: COC011285" format
-                    r'Certificate\s+(?:No|Number)[:\s]+(COC\d{6})',  # "Certificate No: COC011285"
-                ]
-                for pattern in coc_patterns:
-                    coc_match = re.search(pattern, text, re.IGNORECASE)
+                for pattern in COC_NUMBER_PATTERNS:
+                    coc_match = pattern.search(text)
                     if coc_match:
                         data['coc_no'] = coc_match.group(1)
                         logger.info(f"Found COC number: {data['coc_no']}")
@@ -132,12 +247,8 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
 
                 # Extract Shipment number
                 # Pattern: "Shipment no. 6SH264587" or "Shipment: 6SH264587"
-                shipment_patterns = [
-                    r'Shipment\s+no[.:\s]+(\w+)',
-                    r'Shipment[:\s]+(\w+)',
-                ]
-                for pattern in shipment_patterns:
-                    shipment_match = re.search(pattern, text, re.IGNORECASE)
+                for pattern in COC_SHIPMENT_PATTERNS:
+                    shipment_match = pattern.search(text)
                     if shipment_match:
                         data['shipment_no'] = shipment_match.group(1)
                         logger.info(f"Found shipment number: {data['shipment_no']}")
@@ -146,13 +257,8 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
                 # Extract Product info
                 # Pattern: "20580903700 PNR-1000N WPTT" or similar
                 # Need to be careful not to capture too much
-                product_patterns = [
-                    r'(\d{11})\s+(PNR-\S+\s+\w+)',  # More specific: code + PNR-XXX + one word
-                    r'(\d{11})[;\s]+(PNR-[\w-]+(?:\s+\w+)?)',  # code; PNR-XXX optionally one more word
-                    r'(\d{11})\s+([\w-]+Radio[\w\s-]*)',
-                ]
-                for pattern in product_patterns:
-                    product_match = re.search(pattern, text)
+                for pattern in PRODUCT_PATTERNS:
+                    product_match = pattern.search(text)
                     if product_match:
                         data['product_code'] = product_match.group(1)
                         data['product_name'] = product_match.group(2).strip()
@@ -163,14 +269,8 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
                 # Extract Quantity
                 # Pattern: Look for quantity field - should be 1-4 digits, not 11 digits
                 # Avoid matching product codes (11 digits)
-                qty_patterns = [
-                    r'(?:QTY|Quantity)\s+(?:Order|Shipped)[:\s]+(\d{1,4})(?:\s|$)',  # 1-4 digits only
-                    r'Quantity[:\s]+(\d{1,4})(?:\s|$)',
-                    r'QTY[:\s]+(\d{1,4})(?:\s|$)',
-                    r'(?:QTY|Quantity).*?(?:Shipped|Delivered)[:\s]+(\d{1,4})',
-                ]
-                for pattern in qty_patterns:
-                    qty_match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+                for pattern in COC_QUANTITY_PATTERNS:
+                    qty_match = pattern.search(text)
                     if qty_match:
                         qty_value = int(qty_match.group(1))
                         # Sanity check - quantity should be reasonable (1-10000)
@@ -182,17 +282,17 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
                 # Extract Serial Numbers
                 # Pattern: Multiple lines with format "NL13721", "NL13722", etc.
                 # Look for the serial number section and extract all NL##### patterns
-                serial_section_match = re.search(r'Serial\s+Number.*?(?=We certify|Quality|$)', text, re.DOTALL | re.IGNORECASE)
+                serial_section_match = SERIAL_SECTION_PATTERN.search(text)
                 if serial_section_match:
                     serial_text = serial_section_match.group(0)
-                    serials = re.findall(r'NL\d{5}', serial_text)  # NL followed by exactly 5 digits
+                    serials = SERIAL_NUMBER_PATTERN.findall(serial_text)
                     if serials:
                         data['serials'] = serials
                         data['serial_count'] = len(serials)
                         logger.info(f"Found {len(serials)} serial numbers (first: {serials[0]}, last: {serials[-1]})")
                 else:
                     # Fallback: search entire document for NL##### patterns
-                    serials = re.findall(r'NL\d{5}', text)
+                    serials = SERIAL_NUMBER_PATTERN.findall(text)
                     if serials:
                         data['serials'] = serials
                         data['serial_count'] = len(serials)
@@ -200,19 +300,15 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
 
                 # Extract Customer/Acquirer
                 # Pattern: "NETHERLANDS MINISTRY OF DEFENCE" or similar
-                customer_patterns = [
-                    r'(?:Customer|Acquirer)[:\s]+\n?([\w\s]+?)(?:\n\n|\nPart\s+number|$)',
-                    r'(NETHERLANDS MINISTRY OF DEFENCE)',
-                ]
-                for pattern in customer_patterns:
-                    customer_match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+                for pattern in CUSTOMER_PATTERNS:
+                    customer_match = pattern.search(text)
                     if customer_match:
                         if len(customer_match.groups()) > 0:
                             data['customer'] = customer_match.group(1).strip()
                         else:
                             data['customer'] = customer_match.group(0).strip()
                         # Clean up any extra newlines or "Customer" prefix
-                        data['customer'] = re.sub(r'^Customer\s*', '', data['customer'], flags=re.IGNORECASE)
+                        data['customer'] = CUSTOMER_PREFIX_PATTERN.sub('', data['customer'])
                         data['customer'] = data['customer'].strip()
                         logger.info(f"Found customer: {data['customer']}")
                         break
@@ -220,13 +316,8 @@ def extract_company_coc(pdf_path: str) -> Dict[str, Any]:
                 # Extract QA Signer and Date
                 # Pattern: "YESHAYA ORLY 20/Mar/2025" or similar
                 # Need to capture name (letters and spaces only) before date
-                qa_patterns = [
-                    r'Quality\s+Authority.*?\n([A-Z][A-Z\s]+?)\s+\d+\s+(\d+/\w+/\d+)',  # Name, then number, then date
-                    r'Quality\s+Authority.*?\n([A-Z][A-Z\s]+?)\s+(\d+/\w+/\d+)',  # Name directly before date
-                    r'QA.*?\n([A-Z][A-Z\s]+?)\s+(\d+/\w+/\d+)',
-                ]
-                for pattern in qa_patterns:
-                    qa_match = re.search(pattern, text, re.DOTALL)
+                for pattern in QA_PATTERNS:
+                    qa_match = pattern.search(text)
                     if qa_match:
                         data['qa_signer'] = qa_match.group(1).strip()
                         data['date'] = qa_match.group(2)
@@ -276,24 +367,13 @@ def extract_packing_slip(pdf_path: str) -> Dict[str, Any]:
             # Extract Ship To address
             # Note: PDF has Ship To and Sold To in side-by-side columns
             # pdfplumber may interleave them, so we need to filter out Sold To content
-            ship_to_match = re.search(r'Ship\s+To[:\s]+([\s\S]+?)(?:Sold\s+To|Contract|Our\s+Reference)', text, re.IGNORECASE)
+            ship_to_match = SHIP_TO_PATTERN.search(text)
             if ship_to_match:
                 data['ship_to'] = ship_to_match.group(1).strip()
                 # Clean up - take first few lines
                 ship_lines = data['ship_to'].split('\n')[:6]
                 cleaned_lines = []
 
-                # Known "Sold To" content patterns to filter out
-                sold_to_patterns = [
-                    r'NETHERLANDS\s+MINISTRY',
-                    r'\bCOMMIT\b',
-                    r'Projects?\s+Procurement',
-                    r'Herculeslaan',
-                    r'Utrecht\s+MPC',
-                    r'The\s+Netherlands$',
-                    r'Sold\s+To',
-                ]
-
                 for line in ship_lines:
                     line = line.strip()
                     if not line:
@@ -301,16 +381,16 @@ def extract_packing_slip(pdf_path: str) -> Dict[str, Any]:
 
                     # Check if line contains Sold To content
                     is_sold_to = False
-                    for pattern in sold_to_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
+                    for pattern in SOLD_TO_PATTERNS:
+                        if pattern.search(line):
                             is_sold_to = True
                             break
 
                     if is_sold_to:
                         # Try to extract just the Ship To portion (before Sold To content)
                         # Split at known Sold To keywords
-                        for pattern in sold_to_patterns:
-                            match = re.search(pattern, line, re.IGNORECASE)
+                        for pattern in SOLD_TO_PATTERNS:
+                            match = pattern.search(line)
                             if match:
                                 left_part = line[:match.start()].strip()
                                 if left_part and len(left_part) > 2:
@@ -324,13 +404,8 @@ def extract_packing_slip(pdf_path: str) -> Dict[str, Any]:
 
             # Extract Shipment number from Packing Slip
             # Pattern: "Packing Slip 6SH264587" in header
-            shipment_patterns = [
-                r'Packing\s+Slip\s+([A-Z0-9]{8,12})',  # "Packing Slip 6SH264587"
-                r'Shipment[:\s]+([A-Z0-9]{8,12})',  # "Shipment: 6SH264587"
-                r'\b(\d{1,2}[A-Z]{2}\d{6})\b',  # Elbit format: "6SH264587"
-            ]
-            for pattern in shipment_patterns:
-                shipment_match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in PACKING_SLIP_SHIPMENT_PATTERNS:
+                shipment_match = pattern.search(text)
                 if shipment_match:
                     data['shipment_no'] = shipment_match.group(1)
                     logger.info(f"Found shipment number: {data['shipment_no']}")
@@ -339,32 +414,27 @@ def extract_packing_slip(pdf_path: str) -> Dict[str, Any]:
             # Fallback: Try to extract from filename
             if 'shipment_no' not in data:
                 filename = Path(pdf_path).name
-                filename_pattern = r'Packing[_\s]?Slip[_\s]?([A-Z0-9]{8,12})'
-                filename_match = re.search(filename_pattern, filename, re.IGNORECASE)
+                filename_match = PACKING_SLIP_FILENAME_PATTERN.search(filename)
                 if filename_match:
                     data['shipment_no'] = filename_match.group(1)
                     logger.info(f"Found shipment number from filename: {data['shipment_no']}")
 
             # Extract Contract number
-            contract_patterns = [
-                r'Contract[:\s]+[\w\s]*?([\d.]+)',
-                r'Our\s+Reference[:\s]+([\d.]+)',
-            ]
-            for pattern in contract_patterns:
-                contract_match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in PACKING_SLIP_CONTRACT_PATTERNS:
+                contract_match = pattern.search(text)
                 if contract_match:
                     data['contract_number'] = contract_match.group(1).strip()
                     logger.info(f"Found contract: {data['contract_number']}")
                     break
 
             # Extract Customer Item from first page (for backward compatibility)
-            cust_item_match = re.search(r'Customers?\s+Item[:\s]+(\d+)', text, re.IGNORECASE)
+            cust_item_match = CUSTOMER_ITEM_PATTERN.search(text)
             if cust_item_match:
                 data['customer_item'] = cust_item_match.group(1)
                 logger.info(f"Found customer item: {data['customer_item']}")
 
             # Extract ALL Customer Items from ALL pages (for multi-item packing slips)
-            all_customer_items = re.findall(r'Customers?\s+Item[:\s]+(\d+)', all_pages_text, re.IGNORECASE)
+            all_customer_items = CUSTOMER_ITEM_PATTERN.findall(all_pages_text)
             if all_customer_items:
                 data['customer_items'] = all_customer_items
                 logger.info(f"Found {len(all_customer_items)} customer items across all pages: {all_customer_items}")
@@ -373,10 +443,7 @@ def extract_packing_slip(pdf_path: str) -> Dict[str, Any]:
             # Pattern matches rows like: "110 20580966000 SVC-29 UNIT 463.00 EA"
             # or "11 20580911000 POWER UNIT 56.00 EA"
             items = []
-
-            # Pattern for item rows: Dlv (1-3 digits), Part No (11 digits), Description, Qty, EA
-            item_pattern = r'(\d{1,3})\s+(\d{11})\s+([\w\s\-]+?)\s+(\d+\.?\d*)\s*EA'
-            item_matches = re.findall(item_pattern, all_pages_text, re.IGNORECASE)
+            item_matches = ITEM_ROW_PATTERN.findall(all_pages_text)
 
             for match in item_matches:
                 dlv, part_no, description, qty = match
@@ -400,12 +467,8 @@ def extract_packing_slip(pdf_path: str) -> Dict[str, Any]:
             # Extract Part Number and Description (fallback for single item)
             # Pattern: "20580903700 PNR-1000N WPTT 100.00 EA"
             if 'part_no' not in data:
-                part_patterns = [
-                    r'(\d{11})\s+([\w\s-]+?)\s+(\d+\.\d+)\s+EA',
-                    r'Part\s+No[:\s]+(\d{11}).*?Description[:\s]+([\w\s-]+)',
-                ]
-                for pattern in part_patterns:
-                    part_match = re.search(pattern, all_pages_text, re.DOTALL)
+                for pattern in PART_PATTERNS:
+                    part_match = pattern.search(all_pages_text)
                     if part_match:
                         data['part_no'] = part_match.group(1)
                         data['description'] = part_match.group(2).strip()
@@ -419,12 +482,8 @@ def extract_packing_slip(pdf_path: str) -> Dict[str, Any]:
 
             # Extract Quantity if not found above
             if 'quantity' not in data:
-                qty_patterns = [
-                    r'(\d+\.\d+)\s+EA',
-                    r'Quantity[:\s]+(\d+)',
-                ]
-                for pattern in qty_patterns:
-                    qty_match = re.search(pattern, all_pages_text, re.IGNORECASE)
+                for pattern in PACKING_SLIP_QUANTITY_PATTERNS:
+                    qty_match = pattern.search(all_pages_text)
                     if qty_match:
                         try:
                             data['quantity'] = int(float(qty_match.group(1)))
@@ -523,25 +582,18 @@ def normalize_date(date_str: str, output_format: str = "display") -> str:
         return ""
 
     # If already in correct format for display, check if it matches
-    if output_format == "display" and re.match(r'\d{2}/\w{3}/\d{4}', date_str):
+    if output_format == "display" and DISPLAY_DATE_PATTERN.match(date_str):
         return date_str
 
-    # Try to parse various common date formats
-    date_formats = [
-        "%d/%m/%Y",      # 20/03/2025
-        "%d.%m.%Y",      # 20.03.2025
-        "%d-%m-%Y",      # 20-03-2025
-        "%d/%b/%Y",      # 20/Mar/2025
-        "%d/%B/%Y",      # 20/March/2025
-        "%Y-%m-%d",      # 2025-03-20
-        "%d.%m.%y",      # 20.03.25
-        "%d/%m/%y",      # 20/03/25
-    ]
+    # Try the common date formats that use this separator
+    date_str_stripped = date_str.strip()
+    separator_match = DATE_SEPARATOR_PATTERN.search(date_str_stripped)
+    date_formats = DATE_FORMATS_BY_SEPARATOR.get(separator_match.group(), ()) if separator_match else ()
 
     parsed_date = None
     for fmt in date_formats:
         try:
-            parsed_date = datetime.strptime(date_str.strip(), fmt)
+            parsed_date = datetime.strptime(date_str_stripped, fmt)
             break
         except ValueError:
             continue
@@ -194,13 +194,14 @@ async def root():
 @app.post("/api/jobs")
 async def create_job(job: JobCreate):
     job_id = str(uuid.uuid4())
+    now = datetime.utcnow().isoformat()
     jobs_db[job_id] = {
         "id": job_id,
         "name": job.name,
         "submitted_by": job.submitted_by,
         "status": "draft",
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": now,
+        "updated_at": now,
         "files": {},
         "extracted_data": None,
         "validation": None,
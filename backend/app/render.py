@@ -5,6 +5,7 @@ This module handles the rendering of Certificate of Conformity documents
 by flattening nested data structures to match template variables.
 """
 
+import hashlib
 import logging
 import os
 import re
@@ -15,6 +16,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from docxtpl import DocxTemplate
+from jinja2 import Environment, FileSystemBytecodeCache
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,101 @@ ELB_VOS_CE0003
 ELB_VOS_SEC001
 ELB_VOS_CE0004"""
 
+class CompiledTemplateCacheEnvironment(Environment):
+    """
+    Jinja environment that reuses compiled templates for identical sources.
+
+    docxtpl compiles every XML part of the DOCX with from_string() on each
+    render. The parts of a given template file are the same every time, so
+    they only need compiling once. If a bytecode_cache is configured, the
+    compiled code is also persisted so it survives process restarts
+    (from_string() normally bypasses the bytecode cache).
+    """
+
+    max_cached_templates = 64
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compiled_templates = {}
+
+    def from_string(self, source, globals=None, template_class=None):
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals, template_class)
+
+        template = self._compiled_templates.get(source)
+        if template is None:
+            if len(self._compiled_templates) >= self.max_cached_templates:
+                self._compiled_templates.clear()
+            if self.bytecode_cache is None:
+                template = super().from_string(source)
+            else:
+                template = self._from_bytecode_cache(source)
+            self._compiled_templates[source] = template
+        return template
+
+    def _from_bytecode_cache(self, source):
+        # Key the bucket on the source itself; there is no template name or file
+        name = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        bucket = self.bytecode_cache.get_bucket(self, name, None, source)
+        code = bucket.code
+        if code is None:
+            code = self.compile(source)
+            bucket.code = code
+            self.bytecode_cache.set_bucket(bucket)
+        return self.template_class.from_code(self, code, self.make_globals(None), None)
+
+
+# Bytecode buckets are keyed on the template source hash, so every template
+# revision leaves a file behind; the directory is emptied at startup once it
+# holds more than this many, like the in-memory cache clears when full
+MAX_BYTECODE_CACHE_FILES = 256
+
+
+def _create_jinja_env() -> CompiledTemplateCacheEnvironment:
+    """Create the shared render environment, with an on-disk bytecode cache if configured"""
+    cache_dir = os.getenv("JINJA_BYTECODE_CACHE_DIR")
+    if not cache_dir:
+        return CompiledTemplateCacheEnvironment()
+
+    # Cached bytecode is unmarshalled and executed, so only trust a private directory
+    cache_path = Path(cache_dir)
+    try:
+        cache_path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = cache_path.stat()
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            logger.warning(
+                f"Ignoring JINJA_BYTECODE_CACHE_DIR {cache_dir}: it must be owned by this user "
+                "and not group/world-writable"
+            )
+            return CompiledTemplateCacheEnvironment()
+
+        bytecode_cache = FileSystemBytecodeCache(str(cache_path))
+        if len(os.listdir(cache_path)) > MAX_BYTECODE_CACHE_FILES:
+            logger.info(f"Clearing Jinja bytecode cache in {cache_dir}")
+            bytecode_cache.clear()
+    except (OSError, AttributeError) as e:
+        # The cache is optional: an unusable directory, or no os.getuid on
+        # Windows, must not stop the app from importing
+        logger.warning(f"Jinja bytecode cache disabled for {cache_dir}: {e}")
+        return CompiledTemplateCacheEnvironment()
+    return CompiledTemplateCacheEnvironment(bytecode_cache=bytecode_cache)
+
+
+# Shared across renders so compiled template parts are reused
+JINJA_ENV = _create_jinja_env()
+
+# Date formats accepted by normalize_date_to_ddmmyyyy
+DDMMYYYY_DOTTED_PATTERN = re.compile(r'^\d{2}\.\d{2}\.\d{4}$')
+DD_MON_YYYY_PATTERN = re.compile(r'^(\d{1,2})[/\-](\w{3})[/\-](\d{4})$', re.IGNORECASE)
+DD_MM_YYYY_PATTERN = re.compile(r'^(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})$')
+YYYY_MM_DD_PATTERN = re.compile(r'^(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})$')
+
+MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
 
 def normalize_date_to_ddmmyyyy(date_str: str) -> str:
     """
@@ -75,26 +172,19 @@ def normalize_date_to_ddmmyyyy(date_str: str) -> str:
     date_str = date_str.strip()
 
     # Already in correct format
-    if re.match(r'^\d{2}\.\d{2}\.\d{4}$', date_str):
+    if DDMMYYYY_DOTTED_PATTERN.match(date_str):
         return date_str
 
-    # Month name mapping
-    month_map = {
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-        'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-    }
-
     # Try DD/MMM/YYYY format (e.g., "04/Nov/2025")
-    match = re.match(r'^(\d{1,2})[/\-](\w{3})[/\-](\d{4})$', date_str, re.IGNORECASE)
+    match = DD_MON_YYYY_PATTERN.match(date_str)
     if match:
         day = match.group(1).zfill(2)
-        month = month_map.get(match.group(2).lower()[:3], '01')
+        month = MONTH_MAP.get(match.group(2).lower()[:3], '01')
         year = match.group(3)
         return f"{day}.{month}.{year}"
 
     # Try DD-MM-YYYY or DD/MM/YYYY format
-    match = re.match(r'^(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})$', date_str)
+    match = DD_MM_YYYY_PATTERN.match(date_str)
     if match:
         day = match.group(1).zfill(2)
         month = match.group(2).zfill(2)
@@ -102,7 +192,7 @@ def normalize_date_to_ddmmyyyy(date_str: str) -> str:
         return f"{day}.{month}.{year}"
 
     # Try YYYY-MM-DD format
-    match = re.match(r'^(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})$', date_str)
+    match = YYYY_MM_DD_PATTERN.match(date_str)
     if match:
         year = match.group(1)
         month = match.group(2).zfill(2)
@@ -754,8 +844,7 @@ def render_docx(conv_json: Dict[str, Any], job_id: str, template_path: Optional[
             # Fall back to placeholder for development
             out_path = Path(tempfile.gettempdir()) / f"coc-{job_id}.docx"
             import json
-            with open(out_path, 'w') as f:
-                json.dump(conv_json, f, indent=2)
+            out_path.write_text(json.dumps(conv_json, indent=2))
             return out_path
     else:
         template_file = Path(template_path)
@@ -784,7 +873,7 @@ def render_docx(conv_json: Dict[str, Any], job_id: str, template_path: Optional[
     try:
         # Load and render template
         doc = DocxTemplate(str(template_file))
-        doc.render(context)
+        doc.render(context, JINJA_ENV)
         doc.save(str(out_path))
 
         logger.info(f"Successfully rendered document: {out_path}")
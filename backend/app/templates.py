@@ -1,8 +1,10 @@
 # backend/app/templates.py
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import copy
 import json
+import os
 import shutil
 
 TEMPLATES_DIR = Path("templates")
@@ -10,33 +12,104 @@ TEMPLATES_DIR.mkdir(exist_ok=True)
 
 TEMPLATE_METADATA_FILE = TEMPLATES_DIR / "metadata.json"
 
-def load_metadata() -> Dict:
-    """Load template metadata from disk"""
-    if TEMPLATE_METADATA_FILE.exists():
-        return json.loads(TEMPLATE_METADATA_FILE.read_text())
-    return {"templates": []}
+# Parsed metadata, valid while the file's (path, inode, mtime, size) matches "key".
+# Next to the template list the cache keeps column views for hot lookups:
+# "index" maps template id -> list position, "default_mask" holds one byte
+# per template (1 = is_default) so finding the default is a C-level scan.
+_META_CACHE = {"key": None, "value": None, "index": {}, "default_mask": bytearray()}
+
+def _metadata_cache_key(st: os.stat_result) -> tuple:
+    # st_ino changes on every atomic replace, even within one mtime tick
+    return (str(TEMPLATE_METADATA_FILE), st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _cache_metadata(key: tuple, metadata: Dict):
+    templates = metadata.get("templates", [])
+    _META_CACHE["value"] = metadata
+    _META_CACHE["index"] = {t["id"]: i for i, t in enumerate(templates)}
+    _META_CACHE["default_mask"] = bytearray(1 if t.get("is_default") else 0 for t in templates)
+    _META_CACHE["key"] = key
+
+def _load_cached() -> Dict:
+    """Return the shared cache entry for the metadata file (do not mutate)"""
+    try:
+        st = TEMPLATE_METADATA_FILE.stat()
+    except FileNotFoundError:
+        return {"value": {"templates": []}, "index": {}, "default_mask": bytearray()}
+    
+    key = _metadata_cache_key(st)
+    if _META_CACHE["key"] != key:
+        _cache_metadata(key, json.loads(TEMPLATE_METADATA_FILE.read_bytes()))
+    return _META_CACHE
+
+def _load_metadata_for_update() -> Tuple[Dict, Dict]:
+    """Load a private copy of the metadata plus the cache entry describing it"""
+    entry = _load_cached()
+    return copy.deepcopy(entry["value"]), entry
+
+def load_metadata(*, readonly: bool = False) -> Dict:
+    """Load template metadata from disk (cached until the file changes)
+
+    Writers get a private copy to mutate before saving; readonly callers get
+    the shared cached object and must not modify it.
+    """
+    if readonly:
+        return _load_cached()["value"]
+    metadata, _ = _load_metadata_for_update()
+    return metadata
 
 def save_metadata(metadata: Dict):
     """Save template metadata to disk"""
-    TEMPLATE_METADATA_FILE.write_text(json.dumps(metadata, indent=2))
+    # Write a temp file and rename it over the old one so a crash mid-write
+    # never leaves a truncated metadata.json behind
+    tmp_path = TEMPLATE_METADATA_FILE.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(json.dumps(metadata, indent=2).encode())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, TEMPLATE_METADATA_FILE)
+    # Refresh the cache from what was just written instead of re-reading it
+    _cache_metadata(_metadata_cache_key(TEMPLATE_METADATA_FILE.stat()), copy.deepcopy(metadata))
+
+def _copy_file(src: Path, dst: Path):
+    """Copy a file inside the kernel (reflink where the filesystem supports it)"""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # Stopped short (source shrank, or a filesystem that returns 0
+                    # instead of failing); redo the whole copy below
+                    raise OSError("copy_file_range stopped before the end of the file")
+                remaining -= copied
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux), unsupported across these filesystems,
+        # or a short copy
+        shutil.copyfile(src, dst)
 
 def list_templates() -> List[Dict]:
-    """List all available templates"""
-    metadata = load_metadata()
+    """List all available templates (shared cached objects, do not mutate)"""
+    metadata = load_metadata(readonly=True)
     return metadata.get("templates", [])
 
 def get_template(template_id: str) -> Optional[Dict]:
-    """Get template by ID"""
-    templates = list_templates()
-    return next((t for t in templates if t["id"] == template_id), None)
+    """Get template by ID (shared cached object, do not mutate)"""
+    entry = _load_cached()
+    i = entry["index"].get(template_id)
+    if i is None:
+        return None
+    return entry["value"]["templates"][i]
 
 def get_default_template() -> Dict:
-    """Get the default template"""
-    templates = list_templates()
-    default = next((t for t in templates if t.get("is_default")), None)
-    if not default and templates:
-        return templates[0]  # Return first if no default set
-    return default
+    """Get the default template (shared cached object, do not mutate)"""
+    entry = _load_cached()
+    templates = entry["value"].get("templates", [])
+    if not templates:
+        return None
+    i = entry["default_mask"].find(1)
+    if i < 0:
+        i = 0  # Return first if no default set
+    return templates[i]
 
 def add_template(file_path: Path, name: str, version: str, set_as_default: bool = False) -> Dict:
     """Add a new template"""
@@ -50,7 +123,7 @@ def add_template(file_path: Path, name: str, version: str, set_as_default: bool
     dest_path = TEMPLATES_DIR / filename
     
     # Copy template file
-    shutil.copy(file_path, dest_path)
+    _copy_file(file_path, dest_path)
     
     # If setting as default, unset others
     if set_as_default:
@@ -76,46 +149,47 @@ def add_template(file_path: Path, name: str, version: str, set_as_default: bool
 
 def set_default_template(template_id: str) -> bool:
     """Set a template as default"""
-    metadata = load_metadata()
-    templates = metadata.get("templates", [])
+    metadata, entry = _load_metadata_for_update()
+    target = entry["index"].get(template_id)
+    if target is None:
+        return False
     
-    found = False
-    for t in templates:
-        if t["id"] == template_id:
-            t["is_default"] = True
-            found = True
-        else:
-            t["is_default"] = False
+    # Only touch the entries whose flag actually changes
+    templates = metadata["templates"]
+    mask = entry["default_mask"]
+    i = mask.find(1)
+    while i >= 0:
+        templates[i]["is_default"] = False
+        i = mask.find(1, i + 1)
+    templates[target]["is_default"] = True
     
-    if found:
-        save_metadata(metadata)
-    return found
+    save_metadata(metadata)
+    return True
 
 def delete_template(template_id: str) -> bool:
     """Delete a template"""
-    metadata = load_metadata()
+    metadata, entry = _load_metadata_for_update()
     templates = metadata.get("templates", [])
     
-    template = next((t for t in templates if t["id"] == template_id), None)
-    if not template:
+    i = entry["index"].get(template_id)
+    if i is None:
         return False
     
     # Don't delete if it's the only template
     if len(templates) <= 1:  # Changed from == 1 to <= 1 for safety
         return False
     
+    # Remove from metadata
+    template = templates.pop(i)
+    
     # Delete file
     file_path = Path(template["path"])
     if file_path.exists():
         file_path.unlink()
     
-    # Remove from metadata
-    templates = [t for t in templates if t["id"] != template_id]
-    
     # If deleted template was default, set first as default
     if template.get("is_default") and templates:
         templates[0]["is_default"] = True
     
-    metadata["templates"] = templates
     save_metadata(metadata)
-    return True
\ No newline at end of file
+    return True
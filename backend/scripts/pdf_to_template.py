@@ -1,6 +1,4 @@
 # backend/scripts/pdf_to_template.py
-from pdf2docx import Converter
-from docx import Document
 from pathlib import Path
 
 def convert_pdf_to_template():
@@ -13,6 +11,10 @@ def convert_pdf_to_template():
         print(f"ERROR: PDF not found at {pdf_path}")
         return
     
+    # Heavy imports (pdf2docx, python-docx/lxml) only once there is work to do
+    from pdf2docx import Converter
+    from docx import Document
+    
     print(f"Converting: {pdf_path}")
     
     cv = Converter(str(pdf_path))
@@ -40,8 +42,10 @@ def convert_pdf_to_template():
     for table in doc.tables:
         for row in table.rows:
             for cell in row.cells:
+                # cell.text re-joins every paragraph and run, so build it once per cell
+                cell_text = cell.text
                 for old, new in replacements.items():
-                    if old in cell.text:
+                    if old in cell_text:
                         for paragraph in cell.paragraphs:
                             if old in paragraph.text:
                                 paragraph.text = paragraph.text.replace(old, new)
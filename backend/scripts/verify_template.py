@@ -1,5 +1,4 @@
 # backend/scripts/verify_template.py
-from docxtpl import DocxTemplate
 from pathlib import Path
 
 def verify_template():
@@ -9,6 +8,9 @@ def verify_template():
         print(f"ERROR: Template not found at {template_path}")
         return
     
+    # docxtpl pulls in python-docx, lxml and jinja2 - skip that on the error path
+    from docxtpl import DocxTemplate
+    
     try:
         doc = DocxTemplate(str(template_path))
         
@@ -2,61 +2,46 @@
 import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
-import tempfile
-import shutil
+import io
+import zipfile
 from app.main import app
+from app import templates as template_manager
 
 client = TestClient(app)
 
-# Test fixture: Create a temporary DOCX file for testing
-@pytest.fixture
-def test_docx_file():
-    """Create a temporary test DOCX file"""
-    temp_dir = Path(tempfile.mkdtemp())
-    test_file = temp_dir / "test_template.docx"
-    
-    # Create a minimal DOCX (just a ZIP with required structure)
-    import zipfile
-    with zipfile.ZipFile(test_file, 'w') as docx:
+
+def _build_minimal_docx() -> bytes:
+    """Build a minimal DOCX (just a ZIP with required structure) in memory"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as docx:
         docx.writestr('[Content_Types].xml', '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"></Types>')
         docx.writestr('_rels/.rels', '<?xml version="1.0"?><Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"></Relationships>')
         docx.writestr('word/document.xml', '<?xml version="1.0"?><w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body><w:p><w:r><w:t>{{contract_number}}</w:t></w:r></w:p></w:body></w:document>')
-    
-    yield test_file
-    
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return buffer.getvalue()
+
+
+# Built once per module - every upload reuses the same bytes
+_DOCX_BYTES = _build_minimal_docx()
+
+
+@pytest.fixture(scope="session")
+def test_docx_bytes():
+    """Content of a minimal test DOCX file"""
+    return _DOCX_BYTES
 
 
 @pytest.fixture(autouse=True)
-def cleanup_templates():
-    """Clean up templates directory before AND after each test"""
-    # Cleanup BEFORE test
-    templates_dir = Path("templates")
-    if templates_dir.exists():
-        for file in templates_dir.glob("*"):
-            if file.name not in [".gitkeep", "metadata.json"]:
-                try:
-                    file.unlink()
-                except:
-                    pass
-        metadata_file = templates_dir / "metadata.json"
-        if metadata_file.exists():
-            try:
-                metadata_file.unlink()
-            except:
-                pass
-    
-    yield  # Run the test
-    
-    # Cleanup AFTER test
-    if templates_dir.exists():
-        for file in templates_dir.glob("*"):
-            if file.name not in [".gitkeep"]:
-                try:
-                    file.unlink()
-                except:
-                    pass
+def cleanup_templates(tmp_path, monkeypatch):
+    """Point the template store at a fresh per-test directory.
+
+    Nothing touches the shared templates/ folder, so the tests are
+    independent and can run in parallel (pytest -n auto).
+    """
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    monkeypatch.setattr(template_manager, "TEMPLATES_DIR", templates_dir)
+    monkeypatch.setattr(template_manager, "TEMPLATE_METADATA_FILE", templates_dir / "metadata.json")
+    yield templates_dir
 
 
 class TestTemplateAPI:
@@ -69,27 +54,24 @@ class TestTemplateAPI:
         data = response.json()
         assert "templates" in data
         assert isinstance(data["templates"], list)
-        print("✅ Test 2: List templates (empty) - PASSED")
     
     def test_02_get_default_template_not_found(self, cleanup_templates):
         """Test 3: Get default template when none exists"""
         response = client.get("/api/templates/default")
         assert response.status_code == 404
         assert response.json()["detail"] == "No templates available"
-        print("✅ Test 3: Get default template (404) - PASSED")
     
-    def test_03_upload_first_template(self, test_docx_file, cleanup_templates):
+    def test_03_upload_first_template(self, test_docx_bytes, cleanup_templates):
         """Test 4: Upload first template"""
-        with open(test_docx_file, "rb") as f:
-            response = client.post(
-                "/api/templates/upload",
-                files={"file": ("test_template.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={
-                    "name": "Dutch COC v1",
-                    "version": "1.0",
-                    "set_as_default": "true"
-                }
-            )
+        response = client.post(
+            "/api/templates/upload",
+            files={"file": ("test_template.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={
+                "name": "Dutch COC v1",
+                "version": "1.0",
+                "set_as_default": "true"
+            }
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -105,19 +87,17 @@ class TestTemplateAPI:
         
         # Verify file exists
         assert Path(template["path"]).exists()
-        print("✅ Test 4: Upload first template - PASSED")
         
         return template["id"]  # Return for use in other tests
     
-    def test_04_list_templates_with_data(self, test_docx_file, cleanup_templates):
+    def test_04_list_templates_with_data(self, test_docx_bytes, cleanup_templates):
         """Test 5: List templates after upload"""
         # First upload a template
-        with open(test_docx_file, "rb") as f:
-            client.post(
-                "/api/templates/upload",
-                files={"file": ("test.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Test", "version": "1.0", "set_as_default": "true"}
-            )
+        client.post(
+            "/api/templates/upload",
+            files={"file": ("test.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Test", "version": "1.0", "set_as_default": "true"}
+        )
         
         # Now list templates
         response = client.get("/api/templates")
@@ -125,17 +105,15 @@ class TestTemplateAPI:
         data = response.json()
         assert len(data["templates"]) == 1
         assert data["templates"][0]["is_default"] == True
-        print("✅ Test 5: List templates (with data) - PASSED")
     
-    def test_05_get_default_template_success(self, test_docx_file, cleanup_templates):
+    def test_05_get_default_template_success(self, test_docx_bytes, cleanup_templates):
         """Test 6: Get default template after upload"""
         # Upload template
-        with open(test_docx_file, "rb") as f:
-            client.post(
-                "/api/templates/upload",
-                files={"file": ("test.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Test", "version": "1.0", "set_as_default": "true"}
-            )
+        client.post(
+            "/api/templates/upload",
+            files={"file": ("test.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Test", "version": "1.0", "set_as_default": "true"}
+        )
         
         # Get default
         response = client.get("/api/templates/default")
@@ -143,49 +121,43 @@ class TestTemplateAPI:
         data = response.json()
         assert data["name"] == "Test"
         assert data["is_default"] == True
-        print("✅ Test 6: Get default template (success) - PASSED")
     
-    def test_06_upload_second_template(self, test_docx_file, cleanup_templates):
+    def test_06_upload_second_template(self, test_docx_bytes, cleanup_templates):
         """Test 7: Upload second template (not default)"""
         # Upload first template
-        with open(test_docx_file, "rb") as f:
-            client.post(
-                "/api/templates/upload",
-                files={"file": ("test1.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Template 1", "version": "1.0", "set_as_default": "true"}
-            )
+        client.post(
+            "/api/templates/upload",
+            files={"file": ("test1.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Template 1", "version": "1.0", "set_as_default": "true"}
+        )
         
         # Upload second template
-        with open(test_docx_file, "rb") as f:
-            response = client.post(
-                "/api/templates/upload",
-                files={"file": ("test2.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Template 2", "version": "2.0", "set_as_default": "false"}
-            )
+        response = client.post(
+            "/api/templates/upload",
+            files={"file": ("test2.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Template 2", "version": "2.0", "set_as_default": "false"}
+        )
         
         assert response.status_code == 200
         
         # Verify first is still default
         default_response = client.get("/api/templates/default")
         assert default_response.json()["name"] == "Template 1"
-        print("✅ Test 7: Upload second template - PASSED")
     
-    def test_07_set_default_template(self, test_docx_file, cleanup_templates):
+    def test_07_set_default_template(self, test_docx_bytes, cleanup_templates):
         """Test 8: Set second template as default"""
         # Upload two templates
-        with open(test_docx_file, "rb") as f:
-            client.post(
-                "/api/templates/upload",
-                files={"file": ("test1.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Template 1", "version": "1.0", "set_as_default": "true"}
-            )
+        client.post(
+            "/api/templates/upload",
+            files={"file": ("test1.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Template 1", "version": "1.0", "set_as_default": "true"}
+        )
         
-        with open(test_docx_file, "rb") as f:
-            upload_response = client.post(
-                "/api/templates/upload",
-                files={"file": ("test2.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Template 2", "version": "2.0", "set_as_default": "false"}
-            )
+        upload_response = client.post(
+            "/api/templates/upload",
+            files={"file": ("test2.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Template 2", "version": "2.0", "set_as_default": "false"}
+        )
         
         template2_id = upload_response.json()["template"]["id"]
         
@@ -196,42 +168,38 @@ class TestTemplateAPI:
         # Verify it's now default
         default_response = client.get("/api/templates/default")
         assert default_response.json()["name"] == "Template 2"
-        print("✅ Test 8: Set default template - PASSED")
     
-    def test_08_download_template(self, test_docx_file, cleanup_templates):
+    def test_08_download_template(self, test_docx_bytes, cleanup_templates):
         """Test 9: Download template"""
         # Upload template
-        with open(test_docx_file, "rb") as f:
-            upload_response = client.post(
-                "/api/templates/upload",
-                files={"file": ("test.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Test", "version": "1.0", "set_as_default": "true"}
-            )
+        upload_response = client.post(
+            "/api/templates/upload",
+            files={"file": ("test.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Test", "version": "1.0", "set_as_default": "true"}
+        )
         
-        template_id = upload_response.json()["template"]["id"]
+        template = upload_response.json()["template"]
+        assert Path(template["path"]).exists()
         
-        # Download template
-        response = client.get(f"/api/templates/{template_id}/download")
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        print("✅ Test 9: Download template - PASSED")
+        # Download template - only the headers are needed, so don't pull the body
+        with client.stream("GET", f"/api/templates/{template['id']}/download") as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     
-    def test_09_delete_non_default_template(self, test_docx_file, cleanup_templates):
+    def test_09_delete_non_default_template(self, test_docx_bytes, cleanup_templates):
         """Test 10: Delete non-default template"""
         # Upload two templates
-        with open(test_docx_file, "rb") as f:
-            upload1 = client.post(
-                "/api/templates/upload",
-                files={"file": ("test1.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Template 1", "version": "1.0", "set_as_default": "true"}
-            )
+        upload1 = client.post(
+            "/api/templates/upload",
+            files={"file": ("test1.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Template 1", "version": "1.0", "set_as_default": "true"}
+        )
         
-        with open(test_docx_file, "rb") as f:
-            upload2 = client.post(
-                "/api/templates/upload",
-                files={"file": ("test2.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Template 2", "version": "2.0", "set_as_default": "false"}
-            )
+        upload2 = client.post(
+            "/api/templates/upload",
+            files={"file": ("test2.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Template 2", "version": "2.0", "set_as_default": "false"}
+        )
         
         template2_id = upload2.json()["template"]["id"]
         
@@ -242,17 +210,15 @@ class TestTemplateAPI:
         # Verify it's gone
         list_response = client.get("/api/templates")
         assert len(list_response.json()["templates"]) == 1
-        print("✅ Test 10: Delete non-default template - PASSED")
     
-    def test_10_cannot_delete_last_template(self, test_docx_file, cleanup_templates):
+    def test_10_cannot_delete_last_template(self, test_docx_bytes, cleanup_templates):
         """Test 11: Cannot delete last remaining template"""
         # Upload one template
-        with open(test_docx_file, "rb") as f:
-            upload_response = client.post(
-                "/api/templates/upload",
-                files={"file": ("test.docx", f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
-                data={"name": "Test", "version": "1.0", "set_as_default": "true"}
-            )
+        upload_response = client.post(
+            "/api/templates/upload",
+            files={"file": ("test.docx", test_docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            data={"name": "Test", "version": "1.0", "set_as_default": "true"}
+        )
         
         template_id = upload_response.json()["template"]["id"]
         
@@ -260,39 +226,32 @@ class TestTemplateAPI:
         response = client.delete(f"/api/templates/{template_id}")
         assert response.status_code == 400
         assert "Cannot delete template" in response.json()["detail"]
-        print("✅ Test 11: Cannot delete last template - PASSED")
     
-    def test_11_upload_non_docx_file(self, cleanup_templates):
+    def test_11_upload_non_docx_file(self, tmp_path, cleanup_templates):
         """Test 26: Upload non-DOCX file"""
         # Create a fake PDF file
-        temp_file = Path(tempfile.mktemp(suffix=".pdf"))
+        temp_file = tmp_path / "test.pdf"
         temp_file.write_bytes(b"fake pdf content")
         
-        try:
-            with open(temp_file, "rb") as f:
-                response = client.post(
-                    "/api/templates/upload",
-                    files={"file": ("test.pdf", f, "application/pdf")},
-                    data={"name": "Test", "version": "1.0", "set_as_default": "true"}
-                )
-            
-            assert response.status_code == 400
-            assert response.json()["detail"] == "Only DOCX files allowed"
-            print("✅ Test 26: Upload non-DOCX rejected - PASSED")
-        finally:
-            temp_file.unlink()
+        with open(temp_file, "rb") as f:
+            response = client.post(
+                "/api/templates/upload",
+                files={"file": ("test.pdf", f, "application/pdf")},
+                data={"name": "Test", "version": "1.0", "set_as_default": "true"}
+            )
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Only DOCX files allowed"
     
     def test_12_set_default_nonexistent_template(self, cleanup_templates):
         """Test: Set default for non-existent template"""
         response = client.put("/api/templates/fake-uuid/set-default")
         assert response.status_code == 404
-        print("✅ Test: Set default non-existent template - PASSED")
     
     def test_13_delete_nonexistent_template(self, cleanup_templates):
         """Test: Delete non-existent template"""
         response = client.delete("/api/templates/fake-uuid")
         assert response.status_code == 400
-        print("✅ Test: Delete non-existent template - PASSED")
 
 
 # Standalone test runner
@@ -0,0 +1,120 @@
+import io
+import os
+import zipfile
+import pytest
+from docx import Document
+from docxtpl import DocxTemplate
+from app import render
+from app.render import JINJA_ENV
+
+
+def _build_template(tmp_path):
+    """Write a DOCX with a couple of template variables"""
+    document = Document()
+    document.add_paragraph("Contract: {{ contract_number }}")
+    document.add_paragraph("Shipment: {{ shipment_no }}")
+    path = tmp_path / "template.docx"
+    document.save(str(path))
+    return path
+
+
+def _render_document_xml(template_path, context):
+    """Render through JINJA_ENV and return the resulting word/document.xml"""
+    doc = DocxTemplate(str(template_path))
+    doc.render(context, JINJA_ENV)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as docx:
+        return docx.read("word/document.xml")
+
+
+class TestCompiledTemplateCache:
+    def test_second_render_reuses_compiled_parts(self, tmp_path, monkeypatch):
+        """Test rendering the same template twice gives identical output without recompiling"""
+        monkeypatch.setattr(JINJA_ENV, "_compiled_templates", {})
+        compiled_sources = []
+        original_compile = JINJA_ENV.compile
+
+        def counting_compile(source, *args, **kwargs):
+            compiled_sources.append(source)
+            return original_compile(source, *args, **kwargs)
+
+        monkeypatch.setattr(JINJA_ENV, "compile", counting_compile)
+
+        template_path = _build_template(tmp_path)
+        context = {"contract_number": "697.12.5011.01", "shipment_no": "6SH264587"}
+
+        first = _render_document_xml(template_path, context)
+        compiles_after_first = len(compiled_sources)
+        cached_after_first = len(JINJA_ENV._compiled_templates)
+        second = _render_document_xml(template_path, context)
+
+        assert first == second
+        assert b"697.12.5011.01" in first
+        assert compiles_after_first > 0
+        assert len(compiled_sources) == compiles_after_first
+        assert len(JINJA_ENV._compiled_templates) == cached_after_first
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test the compiled template cache is cleared once it reaches its limit"""
+        monkeypatch.setattr(JINJA_ENV, "_compiled_templates", {})
+        for i in range(JINJA_ENV.max_cached_templates + 1):
+            JINJA_ENV.from_string(f"{{{{ value }}}} {i}")
+        assert len(JINJA_ENV._compiled_templates) <= JINJA_ENV.max_cached_templates
+
+
+class TestBytecodeCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "jinja-bc"
+        monkeypatch.setenv("JINJA_BYTECODE_CACHE_DIR", str(cache_dir))
+        return cache_dir
+
+    def test_cache_dir_is_private(self, cache_dir):
+        """Test the bytecode cache directory is created owner-only"""
+        env = render._create_jinja_env()
+        assert env.bytecode_cache is not None
+        assert cache_dir.stat().st_mode & 0o077 == 0
+
+    def test_writable_cache_dir_is_ignored(self, cache_dir):
+        """Test a group/world-writable cache directory is not trusted"""
+        cache_dir.mkdir()
+        os.chmod(cache_dir, 0o777)
+        env = render._create_jinja_env()
+        assert env.bytecode_cache is None
+
+    def test_unusable_cache_dir_disables_cache(self, tmp_path, monkeypatch):
+        """Test a cache directory that cannot be created falls back to no bytecode cache"""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_bytes(b"")
+        monkeypatch.setenv("JINJA_BYTECODE_CACHE_DIR", str(blocker / "jinja-bc"))
+        env = render._create_jinja_env()
+        assert env.bytecode_cache is None
+
+    def test_missing_getuid_disables_cache(self, cache_dir, monkeypatch):
+        """Test platforms without os.getuid (Windows) fall back to no bytecode cache"""
+        monkeypatch.delattr(os, "getuid")
+        env = render._create_jinja_env()
+        assert env.bytecode_cache is None
+
+    def test_compiled_code_survives_restart(self, cache_dir, monkeypatch):
+        """Test a fresh environment loads compiled code from disk instead of compiling"""
+        source = "Contract: {{ contract_number }}"
+        first = render._create_jinja_env().from_string(source).render(contract_number="697.12.5011.01")
+
+        env = render._create_jinja_env()
+
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("template was recompiled")
+
+        monkeypatch.setattr(env, "compile", fail_compile)
+        assert env.from_string(source).render(contract_number="697.12.5011.01") == first
+
+    def test_cache_cleared_when_over_limit(self, cache_dir, monkeypatch):
+        """Test stale buckets are cleared at startup once the limit is exceeded"""
+        monkeypatch.setattr(render, "MAX_BYTECODE_CACHE_FILES", 2)
+        cache_dir.mkdir(mode=0o700)
+        for i in range(3):
+            (cache_dir / f"__jinja2_{i}.cache").write_bytes(b"")
+        render._create_jinja_env()
+        assert os.listdir(cache_dir) == []
@@ -0,0 +1,64 @@
+import json
+import os
+import pytest
+from app import templates as template_manager
+
+
+def _metadata(default_id):
+    return {"templates": [
+        {"id": "a", "name": "A", "filename": "a.docx", "is_default": default_id == "a"},
+        {"id": "b", "name": "B", "filename": "b.docx", "is_default": default_id == "b"},
+    ]}
+
+
+@pytest.fixture
+def metadata_file(tmp_path, monkeypatch):
+    """Point the template store at a per-test metadata.json"""
+    metadata_file = tmp_path / "metadata.json"
+    monkeypatch.setattr(template_manager, "TEMPLATES_DIR", tmp_path)
+    monkeypatch.setattr(template_manager, "TEMPLATE_METADATA_FILE", metadata_file)
+    metadata_file.write_text(json.dumps(_metadata("a"), indent=2))
+    return metadata_file
+
+
+class TestMetadataCache:
+    def test_lookups_use_index_and_default_mask(self, metadata_file):
+        """Test get_template/get_default_template read the cached index and mask"""
+        assert template_manager.get_template("b")["name"] == "B"
+        assert template_manager.get_template("missing") is None
+        assert template_manager.get_default_template()["id"] == "a"
+        assert [t["id"] for t in template_manager.list_templates()] == ["a", "b"]
+
+    def test_set_default_refreshes_cache(self, metadata_file):
+        """Test writes through save_metadata are visible to cached lookups"""
+        assert template_manager.get_default_template()["id"] == "a"
+        template_manager.set_default_template("b")
+        assert template_manager.get_default_template()["id"] == "b"
+        assert not template_manager.get_template("a")["is_default"]
+
+    def test_external_replace_with_same_size_and_mtime(self, metadata_file):
+        """Test an atomic replace behind the cache is picked up even if size and mtime match"""
+        assert template_manager.get_default_template()["id"] == "a"
+        old_stat = metadata_file.stat()
+
+        # Swapping the true/false pair keeps the file size identical
+        replacement = metadata_file.with_suffix(".new")
+        replacement.write_text(json.dumps(_metadata("b"), indent=2))
+        assert replacement.stat().st_size == old_stat.st_size
+        os.utime(replacement, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        os.replace(replacement, metadata_file)
+
+        assert template_manager.get_default_template()["id"] == "b"
+
+
+class TestCopyFile:
+    def test_short_copy_falls_back_to_full_copy(self, tmp_path, monkeypatch):
+        """Test a copy_file_range that returns 0 early does not leave a truncated file"""
+        src = tmp_path / "src.docx"
+        dst = tmp_path / "dst.docx"
+        src.write_bytes(os.urandom(4096))
+        monkeypatch.setattr(os, "copy_file_range", lambda *args, **kwargs: 0, raising=False)
+
+        template_manager._copy_file(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
@@ -6,15 +6,43 @@ This creates all necessary files for the application
 
 import os
 import json
+import asyncio
 from pathlib import Path
 
+# Shared by the generated compose file, README and sample data
+FRONTEND_URL = "http://localhost:5173"
+BACKEND_URL = "http://localhost:8000"
+DEFAULT_TEMPLATE_NAME = "COC_SV_Del165_20.03.2025.docx"
 
-def create_file(path, content):
-    """Create a file with the given content"""
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"✓ Created {path}")
+
+def _write_file(path, content):
+    data = content.encode('utf-8')
+    target = Path(path)
+    # Leave files that already have the generated content untouched
+    try:
+        if target.stat().st_size == len(data) and target.read_bytes() == data:
+            return None
+    except FileNotFoundError:
+        pass
+    target.write_bytes(data)
+    return path
+
+
+async def create_file(path, content):
+    """Create a file with the given content (the blocking write runs in a worker thread)"""
+    return await asyncio.to_thread(_write_file, path, content)
+
+
+async def create_files(files):
+    """Create all files concurrently"""
+    # Create each parent directory once up front instead of once per file
+    for parent in {Path(path).parent for path in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    results = await asyncio.gather(*(create_file(path, content) for path, content in files.items()))
+    created = [path for path in results if path is not None]
+    # Report once, in order, rather than printing from each worker thread
+    if created:
+        print("\n".join(f"✓ Created {path}" for path in created))
 
 
 def create_project():
@@ -23,44 +51,43 @@ def create_project():
     print("🚀 Creating COC-D Switcher project...")
     print("=" * 50)
 
-    files = {}
-
-    # Backend core files
-    files['backend/app/main.py'] = create_main_py()
-    files['backend/app/schemas.py'] = create_schemas_py()
-    files['backend/app/extract.py'] = create_extract_py()
-    files['backend/app/validate.py'] = create_validate_py()
-    files['backend/app/render.py'] = create_render_py()
-    files['backend/app/config.py'] = create_config_py()
-    files['backend/app/__init__.py'] = ''
-    files['backend/tests/__init__.py'] = ''
-    files['backend/requirements.txt'] = create_requirements()
-    files['backend/Dockerfile'] = create_backend_dockerfile()
-
-    # Frontend core files
-    files['frontend/src/App.tsx'] = create_app_tsx()
-    files['frontend/src/main.tsx'] = create_main_tsx()
-    files['frontend/src/index.css'] = create_index_css()
-    files['frontend/package.json'] = create_package_json()
-    files['frontend/index.html'] = create_index_html()
-    files['frontend/vite.config.ts'] = create_vite_config()
-    files['frontend/tsconfig.json'] = create_tsconfig()
-    files['frontend/Dockerfile'] = create_frontend_dockerfile()
-    files['frontend/nginx.conf'] = create_nginx_conf()
-    files['frontend/tailwind.config.cjs'] = create_tailwind_config()
-    files['frontend/postcss.config.cjs'] = create_postcss_config()
-
-    # Sample data
-    files['backend/app/fixtures/sample_data.json'] = create_sample_data()
-
-    # Config files
-    files['.gitignore'] = create_gitignore()
-    files['docker-compose.yml'] = create_docker_compose()
-    files['README.md'] = create_readme()
+    files = {
+        # Backend core files
+        'backend/app/main.py': create_main_py(),
+        'backend/app/schemas.py': create_schemas_py(),
+        'backend/app/extract.py': create_extract_py(),
+        'backend/app/validate.py': create_validate_py(),
+        'backend/app/render.py': create_render_py(),
+        'backend/app/config.py': create_config_py(),
+        'backend/app/__init__.py': '',
+        'backend/tests/__init__.py': '',
+        'backend/requirements.txt': create_requirements(),
+        'backend/Dockerfile': create_backend_dockerfile(),
+
+        # Frontend core files
+        'frontend/src/App.tsx': create_app_tsx(),
+        'frontend/src/main.tsx': create_main_tsx(),
+        'frontend/src/index.css': create_index_css(),
+        'frontend/package.json': create_package_json(),
+        'frontend/index.html': create_index_html(),
+        'frontend/vite.config.ts': create_vite_config(),
+        'frontend/tsconfig.json': create_tsconfig(),
+        'frontend/Dockerfile': create_frontend_dockerfile(),
+        'frontend/nginx.conf': create_nginx_conf(),
+        'frontend/tailwind.config.cjs': create_tailwind_config(),
+        'frontend/postcss.config.cjs': create_postcss_config(),
+
+        # Sample data
+        'backend/app/fixtures/sample_data.json': create_sample_data(),
+
+        # Config files
+        '.gitignore': create_gitignore(),
+        'docker-compose.yml': create_docker_compose(),
+        'README.md': create_readme(),
+    }
 
     # Create all files
-    for path, content in files.items():
-        create_file(path, content)
+    asyncio.run(create_files(files))
 
     print("=" * 50)
     print("✅ Project created successfully!")
@@ -118,13 +145,14 @@ async def root():
 @app.post("/api/jobs")
 async def create_job(job: JobCreate):
     job_id = str(uuid.uuid4())
+    now = datetime.utcnow().isoformat()
     jobs_db[job_id] = {
         "id": job_id,
         "name": job.name,
         "submitted_by": job.submitted_by,
         "status": "draft",
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": now,
+        "updated_at": now,
         "files": {},
         "extracted_data": None,
         "validation": None,
@@ -276,8 +304,7 @@ def render_docx(conv_json: Dict[str, Any], job_id: str) -> Path:
 
     # In production, use docxtpl with actual template
     # For now, create placeholder
-    with open(out_path, 'w') as f:
-        json.dump(conv_json, f, indent=2)
+    out_path.write_text(json.dumps(conv_json, indent=2))
 
     return out_path
 
@@ -295,10 +322,12 @@ def convert_to_pdf(docx_path: Path) -> Path:
 
 def create_config_py():
     return '''import json
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load configuration"""
+    """Load configuration (cached and shared - do not mutate; load_config.cache_clear() reloads)"""
     default_config = {
         "supplier_block": {
             "name": "Elbit Systems C4I and Cyber Ltd",
@@ -551,8 +580,7 @@ def create_postcss_config():
 };'''
 
 
-def create_sample_data():
-    return '''{
+SAMPLE_DATA = {
   "extracted": {
     "from_packing_slip": {
       "sold_to": {"name": "NETHERLANDS MINISTRY OF DEFENCE"},
@@ -595,12 +623,19 @@ def create_sample_data():
     "contract_number": "697.12.5011.01"
   },
   "render_vars": {
-    "docx_template": "COC_SV_Del165_20.03.2025.docx",
-    "output_filename": "COC_SV_Del165_20.03.2025.docx",
+    "docx_template": DEFAULT_TEMPLATE_NAME,
+    "output_filename": DEFAULT_TEMPLATE_NAME,
     "date_format": "DD/MMM/YYYY"
   },
   "validation": {"errors": [], "warnings": []}
-}'''
+}
+
+# Serialized from the dict so the emitted fixture is always valid JSON
+SAMPLE_DATA_JSON = json.dumps(SAMPLE_DATA, indent=2)
+
+
+def create_sample_data():
+    return SAMPLE_DATA_JSON
 
 
 def create_gitignore():
@@ -635,8 +670,7 @@ Thumbs.db
 .env'''
 
 
-def create_docker_compose():
-    return '''version: '3.8'
+DOCKER_COMPOSE_YML = f'''version: '3.8'
 
 services:
   backend:
@@ -646,10 +680,12 @@ services:
     volumes:
       - ./backend/app:/app/app
       - ./backend/templates:/app/templates
+      - jinja-bytecode-cache:/tmp/jinja-bc
     environment:
       - PYTHONUNBUFFERED=1
-      - CORS_ORIGINS=http://localhost:5173
-      - TEMPLATE_PATH=/app/templates/COC_SV_Del165_20.03.2025.docx
+      - CORS_ORIGINS={FRONTEND_URL}
+      - TEMPLATE_PATH=/app/templates/{DEFAULT_TEMPLATE_NAME}
+      - JINJA_BYTECODE_CACHE_DIR=/tmp/jinja-bc
 
   frontend:
     build: ./frontend
@@ -658,43 +694,59 @@ services:
     depends_on:
       - backend
     environment:
-      - VITE_API_URL=http://localhost:8000'''
+      - VITE_API_URL={BACKEND_URL}
+
+volumes:
+  jinja-bytecode-cache:'''
+
+
+def create_docker_compose():
+    return DOCKER_COMPOSE_YML
+
+
+README_MD = f'''# COC-D Switcher
+
+Convert Elbit/Company COCs into Dutch MoD Certificate of Conformity format.
+
+## Quick Start
+
+Using Docker:
+```bash
+docker-compose up --build
+```
+
+Local Development:
+```bash
+# Backend
+cd backend
+python3 -m venv venv
+source venv/bin/activate
+pip install -r requirements.txt
+uvicorn app.main:app --reload --port 8000
+
+# Frontend
+cd frontend
+npm install
+npm run dev
+```
+
+## Access Points
+- Frontend: {FRONTEND_URL}
+- Backend API: {BACKEND_URL}
+- API Docs: {BACKEND_URL}/docs
+
+## Running Tests
+```bash
+cd backend
+pip install -r requirements-test.txt
+pytest tests/
+# Run in parallel worker processes (pytest-xdist)
+pytest tests/ -n auto
+```'''
 
 
 def create_readme():
-    lines = [
-        "# COC-D Switcher",
-        "",
-        "Convert Elbit/Company COCs into Dutch MoD Certificate of Conformity format.",
-        "",
-        "## Quick Start",
-        "",
-        "Using Docker:",
-        "```bash",
-        "docker-compose up --build",
-        "```",
-        "",
-        "Local Development:",
-        "```bash",
-        "# Backend",
-        "cd backend",
-        "python3 -m venv venv",
-        "source venv/bin/activate",
-        "pip install -r requirements.txt",
-        "uvicorn app.main:app --reload --port 8000",
-        "",
-        "# Frontend",
-        "cd frontend",
-        "npm install",
-        "npm run dev",
-        "```",
-        "",
-        "## Access Points",
-        "- Frontend: http://localhost:5173",
-        "- Backend API: http://localhost:8000",
-        "- API Docs: http://localhost:8000/docs"
-    ]
-    return "\n".join(lines)
+    return README_MD
 
 
 if __name__ == "__main__":
@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """Create missing frontend components for COC-D Switcher"""
 
+import asyncio
 from pathlib import Path
 
-def create_file(path, content):
-    """Create file with proper encoding"""
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"Created {path}")
+from create_complete_project import create_files
 
 def create_missing_files():
     print("Creating missing frontend components...")
@@ -20,8 +16,10 @@ def create_missing_files():
     Path('testing/input_samples').mkdir(parents=True, exist_ok=True)
     Path('testing/output_samples').mkdir(parents=True, exist_ok=True)
     
+    files = {}
+    
     # Create SerialEditor component
-    create_file('frontend/src/components/SerialEditor.tsx', '''import React, { useState } from 'react';
+    files['frontend/src/components/SerialEditor.tsx'] = '''import React, { useState } from 'react';
 
 interface SerialEditorProps {
   serials: string[];
@@ -48,10 +46,10 @@ export default function SerialEditor({ serials, onChange }: SerialEditorProps) {
       />
     </div>
   );
-}''')
+}'''
 
     # Create ValidationPanel
-    create_file('frontend/src/components/ValidationPanel.tsx', '''import React from 'react';
+    files['frontend/src/components/ValidationPanel.tsx'] = '''import React from 'react';
 
 interface ValidationIssue {
   code: string;
@@ -100,10 +98,10 @@ export default function ValidationPanel({ errors, warnings }: ValidationPanelPro
       )}
     </div>
   );
-}''')
+}'''
 
     # Create TemplatePreview
-    create_file('frontend/src/components/TemplatePreview.tsx', '''import React from 'react';
+    files['frontend/src/components/TemplatePreview.tsx'] = '''import React from 'react';
 
 export default function TemplatePreview() {
   return (
@@ -136,10 +134,10 @@ export default function TemplatePreview() {
       </div>
     </div>
   );
-}''')
+}'''
 
     # Create test runner
-    create_file('run_full_test.py', '''#!/usr/bin/env python3
+    files['run_full_test.py'] = '''#!/usr/bin/env python3
 """Full workflow test for COC-D Switcher"""
 
 import requests
@@ -149,13 +147,16 @@ from pathlib import Path
 
 API_URL = "http://localhost:8000"
 
+# Reuse one keep-alive connection for every call in the workflow
+session = requests.Session()
+
 def test_workflow():
     print("Testing COC-D Switcher Full Workflow")
     print("=" * 50)
     
     # 1. Create job
     print("1. Creating job...")
-    resp = requests.post(f"{API_URL}/api/jobs", json={
+    resp = session.post(f"{API_URL}/api/jobs", json={
         "name": "Test Shipment 6SH264587",
         "submitted_by": "Test User"
     })
@@ -173,20 +174,20 @@ def test_workflow():
                 'company_coc': ('coc.pdf', f1, 'application/pdf'),
                 'packing_slip': ('packing.pdf', f2, 'application/pdf')
             }
-            resp = requests.post(f"{API_URL}/api/jobs/{job_id}/files", files=files)
+            resp = session.post(f"{API_URL}/api/jobs/{job_id}/files", files=files)
             print(f"   Files uploaded")
     else:
         print("2. No PDFs found, will use fixtures")
     
     # 3. Parse
     print("3. Parsing documents...")
-    resp = requests.post(f"{API_URL}/api/jobs/{job_id}/parse")
+    resp = session.post(f"{API_URL}/api/jobs/{job_id}/parse")
     data = resp.json()
     print(f"   Extracted {len(data.get('part_I', {}).get('serials', []))} serials")
     
     # 4. Validate
     print("4. Validating...")
-    resp = requests.post(f"{API_URL}/api/jobs/{job_id}/validate")
+    resp = session.post(f"{API_URL}/api/jobs/{job_id}/validate")
     validation = resp.json()
     print(f"   {len(validation['errors'])} errors, {len(validation['warnings'])} warnings")
     
@@ -197,7 +198,7 @@ def test_workflow():
     
     # 5. Render
     print("5. Rendering Dutch COC...")
-    resp = requests.post(f"{API_URL}/api/jobs/{job_id}/render")
+    resp = session.post(f"{API_URL}/api/jobs/{job_id}/render")
     if resp.status_code == 200:
         print("   Documents rendered")
     else:
@@ -205,7 +206,7 @@ def test_workflow():
     
     # 6. Get job details
     print("6. Getting final job status...")
-    resp = requests.get(f"{API_URL}/api/jobs/{job_id}")
+    resp = session.get(f"{API_URL}/api/jobs/{job_id}")
     job = resp.json()
     print(f"   Status: {job['status']}")
     
@@ -216,7 +217,10 @@ def test_workflow():
     
 if __name__ == "__main__":
     test_workflow()
-''')
+'''
+    
+    # Create all files
+    asyncio.run(create_files(files))
     
     print("All missing components created!")
     print("\nNext steps:")
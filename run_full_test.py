@@ -8,13 +8,16 @@ from pathlib import Path
 
 API_URL = "http://localhost:8000"
 
+# Reuse one keep-alive connection for every call in the workflow
+session = requests.Session()
+
 def test_workflow():
     print("Testing COC-D Switcher Full Workflow")
     print("=" * 50)
     
     # 1. Create job
     print("1. Creating job...")
-    resp = requests.post(f"{API_URL}/api/jobs", json={
+    resp = session.post(f"{API_URL}/api/jobs", json={
         "name": "Test Shipment 6SH264587",
         "submitted_by": "Test User"
     })
@@ -32,20 +35,20 @@ def test_workflow():
                 'company_coc': ('coc.pdf', f1, 'application/pdf'),
                 'packing_slip': ('packing.pdf', f2, 'application/pdf')
             }
-            resp = requests.post(f"{API_URL}/api/jobs/{job_id}/files", files=files)
+            resp = session.post(f"{API_URL}/api/jobs/{job_id}/files", files=files)
             print(f"   Files uploaded")
     else:
         print("2. No PDFs found, will use fixtures")
     
     # 3. Parse
     print("3. Parsing documents...")
-    resp = requests.post(f"{API_URL}/api/jobs/{job_id}/parse")
+    resp = session.post(f"{API_URL}/api/jobs/{job_id}/parse")
     data = resp.json()
     print(f"   Extracted {len(data.get('part_I', {}).get('serials', []))} serials")
     
     # 4. Validate
     print("4. Validating...")
-    resp = requests.post(f"{API_URL}/api/jobs/{job_id}/validate")
+    resp = session.post(f"{API_URL}/api/jobs/{job_id}/validate")
     validation = resp.json()
     print(f"   {len(validation['errors'])} errors, {len(validation['warnings'])} warnings")
     
@@ -56,7 +59,7 @@ def test_workflow():
     
     # 5. Render
     print("5. Rendering Dutch COC...")
-    resp = requests.post(f"{API_URL}/api/jobs/{job_id}/render")
+    resp = session.post(f"{API_URL}/api/jobs/{job_id}/render")
     if resp.status_code == 200:
         print("   Documents rendered")
     else:
@@ -64,7 +67,7 @@ def test_workflow():
     
     # 6. Get job details
     print("6. Getting final job status...")
-    resp = requests.get(f"{API_URL}/api/jobs/{job_id}")
+    resp = session.get(f"{API_URL}/api/jobs/{job_id}")
     job = resp.json()
     print(f"   Status: {job['status']}")
     